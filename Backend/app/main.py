@@ -5,7 +5,7 @@ Main application entry point
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
@@ -57,7 +57,8 @@ app = FastAPI(
     version=settings.API_VERSION,
     lifespan=lifespan,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson: faster JSON for large responses
 )
 
 
@@ -78,7 +79,7 @@ app.add_middleware(
 async def extractreq_exception_handler(request: Request, exc: ExtractReqException):
     """Handle custom ExtractReq exceptions"""
     logger.error(f"ExtractReq Exception: {exc.message}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": exc.__class__.__name__,
@@ -92,7 +93,7 @@ async def extractreq_exception_handler(request: Request, exc: ExtractReqExceptio
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -3,37 +3,105 @@ Cache Service
 Handles Redis caching for expensive operations like PlayStore scraping and processing
 """
 
-import json
-import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Tuple
 from io import BytesIO
+import blake3
+import msgpack
 import redis
-from app.schemas.models import ProcessingResponse
+import zstandard
+from app.schemas.models import ProcessingResponse, RequirementResult
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# zstd codec for cached PDFs: level 3 compresses PDF streams ~2x at
+# several hundred MB/s, well below the cost of the Redis write.
+# Zstd(De)Compressor objects are NOT thread safe and cache writes run on
+# executor worker threads, so each thread gets its own codec pair.
+_zstd_local = threading.local()
+
+
+def _compress_pdf(pdf_bytes: bytes) -> bytes:
+    """Compress PDF bytes with this thread's zstd compressor"""
+    compressor = getattr(_zstd_local, 'compressor', None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(pdf_bytes)
+
+
+def _decompress_pdf(compressed_pdf: bytes) -> bytes:
+    """Decompress PDF bytes with this thread's zstd decompressor"""
+    decompressor = getattr(_zstd_local, 'decompressor', None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(compressed_pdf)
+
+
+def _pack_response(response: ProcessingResponse) -> bytes:
+    """Serialize a ProcessingResponse to MessagePack bytes"""
+    return msgpack.packb(response.model_dump(), use_bin_type=True)
+
+
+def _unpack_response(meta_data: bytes) -> ProcessingResponse:
+    """
+    Deserialize cached metadata back into a ProcessingResponse
+
+    Cached data was produced by _pack_response from an already-validated
+    model, so model_construct skips Pydantic validation entirely instead
+    of re-validating every one of the (potentially thousands of) nested
+    RequirementResult entries on each cache hit.
+    """
+    data = msgpack.unpackb(meta_data, raw=False)
+    data['requirements'] = [
+        RequirementResult.model_construct(**req)
+        for req in data.get('requirements', [])
+    ]
+    return ProcessingResponse.model_construct(**data)
+
 
 class CacheService:
     """
     Service for caching ProcessingResponse and PDF results using Redis
 
     Cache strategies:
-    - PlayStore URL: SHA256 hash of URL
-    - CSV file: SHA256 hash of file content
-    - Single comment: SHA256 hash of comment text
-    - Value: JSON with ProcessingResponse + base64 PDF
+    - PlayStore URL: BLAKE3 hash of URL
+    - CSV file: BLAKE3 hash of file content
+    - Single comment: BLAKE3 hash of comment text
+    - Value: two sibling keys per entry:
+        <key>:meta - ProcessingResponse serialized with MessagePack
+        <key>:pdf  - zstd-compressed PDF bytes (no base64, no size blowup)
     - TTL: 7 days (604800 seconds)
     """
 
     # Cache TTL: 7 days
     CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 604800 seconds
 
+    # Keys deleted per UNLINK batch when clearing the cache
+    DELETE_BATCH_SIZE = 500
+
+    # In-process LRU in front of Redis: size cap and entry lifetime.
+    # The short TTL bounds staleness — Redis stays the authority, and a
+    # hot entry can't outlive its Redis copy (or an invalidation issued
+    # through another worker process) by more than 5 minutes
+    LOCAL_CACHE_MAX_ENTRIES = 128
+    LOCAL_CACHE_TTL_SECONDS = 300
+
     def __init__(self):
         """Initialize Redis cache service"""
         self.redis_client: Optional[redis.Redis] = None
         self.enabled = False
 
+        # In-process LRU for hot entries: maps cache key to
+        # (expiry timestamp, ProcessingResponse, compressed PDF bytes).
+        # Hits here skip the payload transfer and metadata
+        # deserialization entirely.
+        self._local_cache: "OrderedDict[str, Tuple[float, ProcessingResponse, bytes]]" = OrderedDict()
+        self._local_cache_lock = threading.Lock()
+
         try:
             # Connect to local Redis
             self.redis_client = redis.Redis(
@@ -57,6 +125,9 @@ class CacheService:
             logger.warning(f"⚠ Redis initialization failed: {e}. Cache disabled.")
             self.enabled = False
 
+    # Content at or below this size goes through the memoized fast path
+    SHORT_CONTENT_MAX_BYTES = 512
+
     def _generate_cache_key(self, content: str, prefix: str = "playstore") -> str:
         """
         Generate a cache key from content
@@ -66,16 +137,82 @@ class CacheService:
             prefix: Cache key prefix (playstore, csv, comment)
 
         Returns:
-            Cache key (SHA256 hash)
+            Cache key (BLAKE3 hash)
         """
-        # Normalize content (lowercase, strip whitespace)
-        normalized_content = content.lower().strip()
+        # Short content (URLs, single comments) repeats across requests:
+        # a get followed by a set hashes the same string twice, and hot
+        # URLs hash it on every request. Memoize those keys entirely.
+        if len(content) <= self.SHORT_CONTENT_MAX_BYTES:
+            return self._generate_short_cache_key(content, prefix)
+
+        return self._hash_content(content, prefix)
 
-        # Generate SHA256 hash
-        hash_object = hashlib.sha256(normalized_content.encode())
-        cache_key = f"{prefix}:{hash_object.hexdigest()}"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_short_cache_key(content: str, prefix: str) -> str:
+        """Memoized cache-key derivation for short content (URLs, comments)"""
+        return CacheService._hash_content(content, prefix)
 
-        return cache_key
+    def _local_cache_get(
+        self,
+        cache_key: str
+    ) -> Optional[Tuple[ProcessingResponse, bytes]]:
+        """Get a live entry from the in-process LRU, refreshing its recency"""
+        with self._local_cache_lock:
+            entry = self._local_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            expires_at, response, compressed_pdf = entry
+
+            # Expired entries are misses: drop them so the next request
+            # re-validates against Redis
+            if time.monotonic() >= expires_at:
+                del self._local_cache[cache_key]
+                return None
+
+            self._local_cache.move_to_end(cache_key)
+            return response, compressed_pdf
+
+    def _local_cache_put(
+        self,
+        cache_key: str,
+        response: ProcessingResponse,
+        compressed_pdf: bytes
+    ):
+        """Store an entry in the in-process LRU, evicting the oldest"""
+        expires_at = time.monotonic() + self.LOCAL_CACHE_TTL_SECONDS
+
+        with self._local_cache_lock:
+            self._local_cache[cache_key] = (expires_at, response, compressed_pdf)
+            self._local_cache.move_to_end(cache_key)
+            while len(self._local_cache) > self.LOCAL_CACHE_MAX_ENTRIES:
+                self._local_cache.popitem(last=False)
+
+    @staticmethod
+    def _hash_content(content: str, prefix: str) -> str:
+        """Hash normalized content into a prefixed BLAKE3 cache key"""
+        # Encode once; strip is cheap and allocation-free when there is
+        # no surrounding whitespace
+        normalized = content.strip().encode('utf-8', 'ignore')
+
+        # Case-fold only short content (URLs, comments). CSV file content
+        # is hashed as-is: lowercasing it would copy megabytes just to
+        # normalize case that never varies between uploads of one file.
+        if prefix != "csv" and len(normalized) <= 256:
+            normalized = normalized.lower()
+
+        # Generate BLAKE3 hash (non-cryptographic use, much faster than
+        # SHA-256 and SIMD-parallel on large CSV content)
+        hash_object = blake3.blake3(normalized)
+        return f"{prefix}:{hash_object.hexdigest(length=16)}"
+
+    def _refresh_entry_ttl(self, cache_key: str):
+        """Renew the TTL of both sibling keys of an entry in one round-trip"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.expire(f"{cache_key}:meta", self.CACHE_TTL_SECONDS)
+        pipe.expire(f"{cache_key}:pdf", self.CACHE_TTL_SECONDS)
+        pipe.execute()
 
     def _get_cached_result_generic(
         self,
@@ -100,23 +237,41 @@ class CacheService:
         try:
             cache_key = self._generate_cache_key(content, prefix)
 
-            # Get from Redis
-            cached_data = self.redis_client.get(cache_key)
+            # Hot entries are served from the in-process LRU; still touch
+            # the Redis TTL so frequently-read entries don't expire
+            local_entry = self._local_cache_get(cache_key)
+            if local_entry is not None:
+                response, compressed_pdf = local_entry
+                pdf_buffer = BytesIO(_decompress_pdf(compressed_pdf))
+
+                self._refresh_entry_ttl(cache_key)
+
+                logger.info(f"✓ Local cache HIT for {description}: {content[:50]}...")
+                return response, pdf_buffer
 
-            if cached_data is None:
+            # Get both parts in a single round-trip
+            meta_data, pdf_bytes = self.redis_client.mget(
+                cache_key + ":meta",
+                cache_key + ":pdf"
+            )
+
+            if meta_data is None or pdf_bytes is None:
                 logger.info(f"Cache MISS for {description}: {content[:50]}...")
                 return None
 
-            # Deserialize
-            data = json.loads(cached_data)
+            # Touch-on-access: a hit renews the 7-day TTL so entries
+            # expire only after 7 days without being requested
+            self._refresh_entry_ttl(cache_key)
+
+            # Deserialize metadata and reconstruct ProcessingResponse
+            # without re-validating our own trusted data
+            response = _unpack_response(meta_data)
 
-            # Reconstruct ProcessingResponse
-            response = ProcessingResponse(**data['response'])
+            # PDF is stored zstd-compressed
+            pdf_buffer = BytesIO(_decompress_pdf(pdf_bytes))
 
-            # Reconstruct PDF BytesIO from base64
-            import base64
-            pdf_bytes = base64.b64decode(data['pdf_base64'])
-            pdf_buffer = BytesIO(pdf_bytes)
+            # Promote the entry to the local LRU for subsequent requests
+            self._local_cache_put(cache_key, response, pdf_bytes)
 
             logger.info(f"✓ Cache HIT for {description}: {content[:50]}... (saved processing time)")
 
@@ -147,7 +302,7 @@ class CacheService:
         prefix: str,
         description: str,
         response: ProcessingResponse,
-        pdf_buffer: BytesIO
+        pdf_bytes: bytes
     ) -> bool:
         """
         Generic method to cache result
@@ -157,7 +312,7 @@ class CacheService:
             prefix: Cache key prefix
             description: Description for logging
             response: ProcessingResponse object
-            pdf_buffer: PDF BytesIO buffer
+            pdf_bytes: Raw PDF bytes
 
         Returns:
             True if cached successfully, False otherwise
@@ -168,26 +323,41 @@ class CacheService:
         try:
             cache_key = self._generate_cache_key(content, prefix)
 
-            # Serialize PDF to base64
-            import base64
-            pdf_buffer.seek(0)  # Reset buffer position
-            pdf_base64 = base64.b64encode(pdf_buffer.read()).decode('utf-8')
+            # Derive the sibling keys once and reuse them below
+            meta_key = cache_key + ":meta"
+            pdf_key = cache_key + ":pdf"
 
-            # Prepare data for caching
-            cache_data = {
-                'response': response.model_dump(),  # Pydantic v2
-                'pdf_base64': pdf_base64
-            }
+            # The key is a hash of the content, so an existing entry is
+            # identical by construction: just refresh its TTL and skip
+            # re-serializing and re-sending the whole payload. Both keys
+            # must be present — if one was evicted independently (gets
+            # require both, so the entry is effectively a miss), fall
+            # through to the full write so the entry self-heals
+            if self.redis_client.exists(meta_key, pdf_key) == 2:
+                self._refresh_entry_ttl(cache_key)
 
-            # Serialize to JSON
-            serialized_data = json.dumps(cache_data)
+                logger.info(f"✓ Refreshed cache TTL for {description}: {content[:50]}...")
+                return True
 
-            # Store in Redis with TTL
-            self.redis_client.setex(
-                cache_key,
-                self.CACHE_TTL_SECONDS,
-                serialized_data
-            )
+            # Serialize metadata with MessagePack (Pydantic v2)
+            meta = _pack_response(response)
+
+            # Compress the PDF before storing
+            compressed_pdf = _compress_pdf(pdf_bytes)
+
+            # Store both parts in Redis with TTL using a single round-trip.
+            # Only the playstore counter is ever reported (and cleared by
+            # clear_all_cache), so don't grow orphan counters for other
+            # prefixes
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(meta_key, self.CACHE_TTL_SECONDS, meta)
+            pipe.setex(pdf_key, self.CACHE_TTL_SECONDS, compressed_pdf)
+            if prefix == "playstore":
+                pipe.incr("playstore:stats:count")
+            pipe.execute()
+
+            # Seed the local LRU so an immediate re-request skips Redis
+            self._local_cache_put(cache_key, response, compressed_pdf)
 
             logger.info(f"✓ Cached result for {description}: {content[:50]}... (TTL: 7 days)")
 
@@ -201,7 +371,7 @@ class CacheService:
         self,
         url: str,
         response: ProcessingResponse,
-        pdf_buffer: BytesIO
+        pdf_bytes: bytes
     ) -> bool:
         """
         Cache result for a PlayStore URL
@@ -209,12 +379,12 @@ class CacheService:
         Args:
             url: PlayStore URL
             response: ProcessingResponse object
-            pdf_buffer: PDF BytesIO buffer
+            pdf_bytes: Raw PDF bytes
 
         Returns:
             True if cached successfully, False otherwise
         """
-        return self._cache_result_generic(url, "playstore", "PlayStore URL", response, pdf_buffer)
+        return self._cache_result_generic(url, "playstore", "PlayStore URL", response, pdf_bytes)
 
     def invalidate_cache(self, url: str) -> bool:
         """
@@ -231,9 +401,19 @@ class CacheService:
 
         try:
             cache_key = self._generate_cache_key(url)
-            deleted = self.redis_client.delete(cache_key)
+
+            with self._local_cache_lock:
+                self._local_cache.pop(cache_key, None)
+
+            deleted = self.redis_client.delete(f"{cache_key}:meta", f"{cache_key}:pdf")
 
             if deleted:
+                # Clamp the decrement: entries written before the counter
+                # existed (or after a partial write that never incremented)
+                # must not drive the reported total negative
+                count = self.redis_client.get("playstore:stats:count")
+                if count is not None and int(count) > 0:
+                    self.redis_client.decr("playstore:stats:count")
                 logger.info(f"✓ Cache invalidated for URL: {url[:50]}...")
                 return True
             else:
@@ -255,11 +435,25 @@ class CacheService:
             return False
 
         try:
-            # Find all playstore cache keys
-            keys = self.redis_client.keys("playstore:*")
+            # Drop local copies before clearing the Redis keyspace
+            with self._local_cache_lock:
+                self._local_cache.clear()
+
+            # Iterate with SCAN (non-blocking) and delete in batches with
+            # UNLINK so Redis reclaims memory off the main thread
+            deleted = 0
+            batch = []
+
+            for key in self.redis_client.scan_iter(match="playstore:*", count=1000):
+                batch.append(key)
+                if len(batch) >= self.DELETE_BATCH_SIZE:
+                    deleted += self.redis_client.unlink(*batch)
+                    batch = []
 
-            if keys:
-                deleted = self.redis_client.delete(*keys)
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
+
+            if deleted:
                 logger.info(f"✓ Cleared {deleted} cache entries")
                 return True
             else:
@@ -291,7 +485,7 @@ class CacheService:
         self,
         csv_content: str,
         response: ProcessingResponse,
-        pdf_buffer: BytesIO
+        pdf_bytes: bytes
     ) -> bool:
         """
         Cache result for CSV file content
@@ -299,12 +493,12 @@ class CacheService:
         Args:
             csv_content: Content of the CSV file
             response: ProcessingResponse object
-            pdf_buffer: PDF BytesIO buffer
+            pdf_bytes: Raw PDF bytes
 
         Returns:
             True if cached successfully, False otherwise
         """
-        return self._cache_result_generic(csv_content, "csv", "CSV file", response, pdf_buffer)
+        return self._cache_result_generic(csv_content, "csv", "CSV file", response, pdf_bytes)
 
     # ========== Single Comment Cache Methods ==========
 
@@ -327,7 +521,7 @@ class CacheService:
         self,
         comment: str,
         response: ProcessingResponse,
-        pdf_buffer: BytesIO
+        pdf_bytes: bytes
     ) -> bool:
         """
         Cache result for single comment
@@ -335,12 +529,12 @@ class CacheService:
         Args:
             comment: Comment text
             response: ProcessingResponse object
-            pdf_buffer: PDF BytesIO buffer
+            pdf_bytes: Raw PDF bytes
 
         Returns:
             True if cached successfully, False otherwise
         """
-        return self._cache_result_generic(comment, "comment", "single comment", response, pdf_buffer)
+        return self._cache_result_generic(comment, "comment", "single comment", response, pdf_bytes)
 
     # ========== Cache Management Methods ==========
 
@@ -359,12 +553,16 @@ class CacheService:
             }
 
         try:
-            keys = self.redis_client.keys("playstore:*")
+            # O(1) read of the entry counter maintained on set/invalidate
+            # (entries that expire via TTL are not decremented, so the
+            # counter is an upper bound rather than an exact count)
+            count = self.redis_client.get("playstore:stats:count")
+            total_keys = int(count) if count is not None else 0
             info = self.redis_client.info("memory")
 
             return {
                 "enabled": True,
-                "total_keys": len(keys),
+                "total_keys": total_keys,
                 "memory_used_bytes": info.get("used_memory", 0),
                 "memory_used": f"{info.get('used_memory', 0) / (1024 * 1024):.2f} MB"
             }
@@ -3,6 +3,7 @@ Orchestrator Service
 Coordinates all services to process requirements end-to-end
 """
 
+import asyncio
 import time
 import csv
 from io import StringIO, BytesIO
@@ -66,15 +67,22 @@ class OrchestratorService:
             source_type="single"
         )
 
-        # Generate PDF
-        pdf_buffer = pdf_service.generate_pdf(response)
+        # Generate PDF in a worker thread (ReportLab is CPU-bound and
+        # would otherwise block the event loop)
+        pdf_buffer = await asyncio.to_thread(pdf_service.generate_pdf, response)
 
         logger.info(f"Single comment processed in {processing_time_ms:.2f}ms")
 
-        # Cache the result
-        cache_service.cache_comment_result(comment, response, pdf_buffer)
+        # Cache the result in the background; the response doesn't need
+        # to wait for the Redis write (cache_* methods never raise).
+        # Snapshot the PDF to immutable bytes so the worker thread never
+        # shares the live buffer being streamed to the client
+        asyncio.get_running_loop().run_in_executor(
+            None, cache_service.cache_comment_result, comment, response,
+            pdf_buffer.getvalue()
+        )
 
-        # Reset PDF buffer position after caching
+        # Ensure PDF buffer is at start before streaming it out
         pdf_buffer.seek(0)
 
         return response, pdf_buffer
@@ -146,15 +154,20 @@ class OrchestratorService:
                 source_type="csv"
             )
 
-            # Generate PDF
-            pdf_buffer = pdf_service.generate_pdf(response)
+            # Generate PDF in a worker thread (ReportLab is CPU-bound and
+            # would otherwise block the event loop)
+            pdf_buffer = await asyncio.to_thread(pdf_service.generate_pdf, response)
 
             logger.info(f"CSV processed in {processing_time_ms:.2f}ms")
 
-            # Cache the result using CSV content
-            cache_service.cache_csv_result(csv_text, response, pdf_buffer)
+            # Cache the result using CSV content in the background,
+            # snapshotting the PDF to immutable bytes for the worker thread
+            asyncio.get_running_loop().run_in_executor(
+                None, cache_service.cache_csv_result, csv_text, response,
+                pdf_buffer.getvalue()
+            )
 
-            # Reset PDF buffer position after caching
+            # Ensure PDF buffer is at start before streaming it out
             pdf_buffer.seek(0)
 
             return response, pdf_buffer
@@ -232,8 +245,9 @@ class OrchestratorService:
         # Add scraping statistics to response (for frontend display)
         response.scraping_stats = scraping_stats
 
-        # Generate PDF
-        pdf_buffer = pdf_service.generate_pdf(response)
+        # Generate PDF in a worker thread (ReportLab is CPU-bound and
+        # would otherwise block the event loop)
+        pdf_buffer = await asyncio.to_thread(pdf_service.generate_pdf, response)
 
         logger.info(
             f"✓ Play Store processing completed: "
@@ -241,10 +255,14 @@ class OrchestratorService:
             f"{scraping_stats['total_scraped']} reviews in {processing_time_ms:.2f}ms"
         )
 
-        # Cache the result for future requests
-        cache_service.cache_result(url, response, pdf_buffer)
+        # Cache the result for future requests in the background,
+        # snapshotting the PDF to immutable bytes for the worker thread
+        asyncio.get_running_loop().run_in_executor(
+            None, cache_service.cache_result, url, response,
+            pdf_buffer.getvalue()
+        )
 
-        # Reset PDF buffer position after caching
+        # Ensure PDF buffer is at start before streaming it out
         pdf_buffer.seek(0)
 
         return response, pdf_buffer
@@ -5,6 +5,7 @@ Handles the core logic of processing comments and extracting requirements
 
 from typing import List, Dict
 from app.services.huggingface_service import huggingface_service
+from app.services.description_service import description_service
 from app.schemas.requirements import BinaryPrediction, MulticlassPrediction, CommentAnalysis
 from app.schemas.models import RequirementResult
 from app.core.logger import get_logger
@@ -89,7 +90,6 @@ class ProcessingService:
 
             # Step 3: Generate description if requested
             if generate_description:
-                from app.services.description_service import description_service
                 description = description_service.generate_description(
                     comment=comment,
                     subcharacteristic=multiclass_result['label']
@@ -144,7 +144,6 @@ class ProcessingService:
         # Step 4: Generate descriptions if requested
         descriptions = []
         if generate_descriptions and valid_comments:
-            from app.services.description_service import description_service
             descriptions = [
                 description_service.generate_description(
                     comment=comment,